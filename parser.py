@@ -1,14 +1,50 @@
+import dataclasses
+import hashlib
 import json
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterable, Iterator, Optional, List, Sequence, Tuple
+
+# pdfplumber is heavy to import, so it is only loaded once a PDF is read;
+# PDF_SUPPORT stays None until then.
+_pdfplumber = None
+PDF_SUPPORT = None
+
+try:
+    import hyperscan
+    HYPERSCAN_SUPPORT = True
+except ImportError:
+    HYPERSCAN_SUPPORT = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
+
+# numba takes most of a second to import and load the kernel, so it is only
+# brought in the first time a large ASCII document is normalized;
+# NUMBA_SUPPORT stays None until then.
+_normalize_kernel = None
+NUMBA_SUPPORT = None
+
+# numpy is only used by ParsedBatch.validate, so it is imported there on first
+# use; NUMPY_SUPPORT stays None until then.
+_numpy = None
+NUMPY_SUPPORT = None
 
 try:
-    import pdfplumber
-    PDF_SUPPORT = True
+    import orjson
+    ORJSON_SUPPORT = True
 except ImportError:
-    PDF_SUPPORT = False
+    ORJSON_SUPPORT = False
 
 
 FINANCIAL_FIELDS = [
@@ -28,62 +64,671 @@ CURRENCY_SYMBOLS = r'(?:USD|INR|\$|Rs\.?)?'
 NUMERIC_PATTERN = r'([\d,]+(?:\.\d{2})?)'
 DATE_PATTERN = r'(\d{2}[/-]\d{2}[/-]\d{4})'
 
+_POLICY_NUMBER_RES = (
+    re.compile(r'Policy\s+(?:Number|No\.?|#)\s*:?\s*([A-Z0-9][A-Z0-9-/\\]+)', re.IGNORECASE),
+)
+_POLICYHOLDER_RES = (
+    re.compile(r'Policyholder(?:\s+Name)?:\s*([A-Za-z\s]+?)(?:\n|$)', re.IGNORECASE),
+)
+_POLICY_TYPE_RES = (
+    re.compile(r'Policy\s+Type:\s*([A-Za-z\s]+?)(?:\n|$)', re.IGNORECASE),
+)
+_EFFECTIVE_DATE_RES = (
+    re.compile(rf'(?:Effective|Start|Commencement|From)\s+Date\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Policy\s+(?:Start|Effective)\s+Date\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Valid|Coverage)\s+From\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+)
+_EXPIRATION_DATE_RES = (
+    re.compile(rf'(?:Expiration|Expiry|End|To)\s+Date\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Policy\s+(?:End|Expiry)\s+Date\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Valid|Coverage)\s+(?:Until|To)\s*:?\s*{DATE_PATTERN}', re.IGNORECASE),
+)
+_COVERAGE_AMOUNT_RES = (
+    re.compile(rf'(?:Coverage|Sum)\s+(?:Amount|Insured)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Sum\s+Insured\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Insured\s+(?:Amount|Value)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_PREMIUM_RES = (
+    re.compile(rf'(?:Base|Basic|Net)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Monthly|Annual|Yearly)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_TOTAL_PREMIUM_RES = (
+    re.compile(rf'Total\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Gross|Final)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Premium\s+(?:Total|Amount)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_TAXES_RES = (
+    re.compile(rf'(?:GST|Tax|Service\s+Tax)\s*(?:Amount)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Tax(?:es)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Policy|Insurance)\s+Tax\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'GST\s*@?\s*\d+%?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_FEES_RES = (
+    re.compile(rf'(?:Administrative|Processing|Service)\s+Fee\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'Fee(?:s)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Stamp|Policy)\s+Fee\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_DEDUCTIBLE_RES = (
+    re.compile(rf'Deductible\s*(?:Amount)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Standard|Basic)\s+Deductible\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+    re.compile(rf'(?:Excess|Co-payment)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}', re.IGNORECASE),
+)
+_PAYMENT_FREQUENCY_RES = (
+    re.compile(r'Payment\s+Frequency\s*:?\s*((?:Monthly|Quarterly|Annual|Yearly|Bi-?annual|Semi-?annual))', re.IGNORECASE),
+    re.compile(r'Billed\s+(Monthly|Quarterly|Annual|Yearly)', re.IGNORECASE),
+    re.compile(r'(?:Monthly|Quarterly|Annual|Yearly)\s+(?:Payment|Billing)', re.IGNORECASE),
+)
+_COPAY_RES = (
+    re.compile(r'Co-?pay\s*:?\s*\$?([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    re.compile(r'Copayment\s*:?\s*\$?([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+)
+_COVERAGE_DETAILS_RE = re.compile(r'Coverage Details:(.*?)(?=\n\n|\Z)', re.DOTALL | re.IGNORECASE)
+# Captures each item already stripped: the text up to the last non-space on
+# its line, or an empty item when only whitespace follows the dash.
+_ITEM_RE = re.compile(r'-\s*(.*\S|(?=.))')
+_BLANK_RUN = re.compile(r'\n{3,}')
+# Once loaded, the numba kernel saves about 9 us per KB over the str path, but
+# loading it costs 0.4-0.8 s per process, so smaller documents skip it.
+_NUMBA_MIN_LENGTH = 1 << 16
+
+
+def _normalize_bytes(in_buf, out_buf) -> int:
+    # Byte-level normalize_text for ASCII input: drops whitespace at line
+    # edges, collapses inner runs to one space and keeps at most two
+    # newlines in a row. Writes into out_buf and returns the output length.
+    length = 0
+    newlines = 0
+    in_line = False
+    pending_space = False
+    for i in range(in_buf.shape[0]):
+        byte = in_buf[i]
+        if byte == 10:
+            in_line = False
+            pending_space = False
+            newlines += 1
+            if newlines <= 2:
+                out_buf[length] = 10
+                length += 1
+        elif byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31:
+            if in_line:
+                pending_space = True
+        else:
+            if pending_space:
+                out_buf[length] = 32
+                length += 1
+                pending_space = False
+            out_buf[length] = byte
+            length += 1
+            in_line = True
+            newlines = 0
+    return length
+
+
+def _load_numpy():
+    global _numpy, NUMPY_SUPPORT
+    if NUMPY_SUPPORT is None:
+        try:
+            import numpy
+        except ImportError:
+            NUMPY_SUPPORT = False
+        else:
+            _numpy = numpy
+            NUMPY_SUPPORT = True
+    return _numpy
+
+
+def _load_normalize_kernel():
+    global _normalize_kernel, NUMBA_SUPPORT
+    if NUMBA_SUPPORT is None:
+        try:
+            import numba
+            import numpy as np
+        except ImportError:
+            NUMBA_SUPPORT = False
+        else:
+            compiled = numba.njit(
+                numba.int64(numba.types.Array(numba.uint8, 1, 'C', readonly=True), numba.uint8[::1]),
+                cache=True,
+            )(_normalize_bytes)
+
+            def kernel(text: str) -> str:
+                in_buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+                out_buf = np.empty_like(in_buf)
+                length = compiled(in_buf, out_buf)
+                return out_buf[:length].tobytes().decode('ascii')
+
+            _normalize_kernel = kernel
+            NUMBA_SUPPORT = True
+    return _normalize_kernel
+
+
+_FIELD_PATTERNS = (
+    ('policy_number', _POLICY_NUMBER_RES),
+    ('policyholder', _POLICYHOLDER_RES),
+    ('policy_type', _POLICY_TYPE_RES),
+    ('effective_date', _EFFECTIVE_DATE_RES),
+    ('expiration_date', _EXPIRATION_DATE_RES),
+    ('coverage_amount', _COVERAGE_AMOUNT_RES),
+    ('premium', _PREMIUM_RES),
+    ('total_premium', _TOTAL_PREMIUM_RES),
+    ('taxes', _TAXES_RES),
+    ('fees', _FEES_RES),
+    ('deductible', _DEDUCTIBLE_RES),
+    ('payment_frequency', _PAYMENT_FREQUENCY_RES),
+    ('copay', _COPAY_RES),
+)
+
+_LEADING_ALTERNATION = re.compile(r'\(\?:([^()]+)\)(?![?*+{])(.*)', re.DOTALL)
+_FIRST_CAPTURE = re.compile(r'(?<!\\)\((?!\?)')
+_LITERAL_PREFIX = re.compile(r'[A-Za-z]+')
+
+# The only non-ASCII characters that re.IGNORECASE folds onto an ASCII letter.
+# The first letter of each branch sits outside the (?i:...) group, so its
+# class lists them explicitly to match what the field patterns match.
+_EXTRA_CASE_FOLDS = {'i': '\u0130\u0131', 'k': '\u212a', 's': '\u017f'}
+
+
+def _expand_leading_alternation(pattern: str) -> List[str]:
+    leading = _LEADING_ALTERNATION.match(pattern)
+    if leading:
+        return [alternative + leading.group(2) for alternative in leading.group(1).split('|')]
+    return [pattern]
+
+
+def _literal_prefix(source: str) -> str:
+    prefix = _LITERAL_PREFIX.match(source).group()
+    if source[len(prefix):len(prefix) + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]
+    return prefix.lower()
+
+
+def _build_master_pattern() -> Tuple[re.Pattern, Dict[str, Tuple[str, int, bool]]]:
+    # Every field pattern becomes a branch keyed on its first letter, with the
+    # rest of the pattern inside a lookahead so overlapping labels such as
+    # "Total Premium" and "Premium" are both seen. Branches of different fields
+    # never match at the same offset, so trying them in table order keeps the
+    # per-field pattern priority of the extract_* methods. A pattern without a
+    # capture group still claims its rank but yields no value, as it does in
+    # _extract_with_patterns.
+    bodies_by_letter: Dict[str, List[str]] = {}
+    branches: Dict[str, Tuple[str, int, bool]] = {}
+    for field, patterns in _FIELD_PATTERNS:
+        for rank, compiled in enumerate(patterns):
+            for source in _expand_leading_alternation(compiled.pattern):
+                name = f'{field}_{len(branches)}'
+                body, captures = _FIRST_CAPTURE.subn(f'(?P<{name}>', source[1:], count=1)
+                if not captures:
+                    body += f'(?P<{name}>)'
+                branches[name] = (field, rank, bool(captures))
+                bodies_by_letter.setdefault(source[0].lower(), []).append(f'(?:{body})')
+
+    alternation = '|'.join(
+        f"[{letter.upper()}{letter}{_EXTRA_CASE_FOLDS.get(letter, '')}](?=(?i:{'|'.join(bodies)}))"
+        for letter, bodies in bodies_by_letter.items()
+    )
+    return re.compile(alternation), branches
+
+
+_MASTER_RE, _MASTER_BRANCHES = _build_master_pattern()
+
+_PATTERN_TABLE = [
+    (field, rank, compiled)
+    for field, patterns in _FIELD_PATTERNS
+    for rank, compiled in enumerate(patterns)
+]
+_PATTERNS_BY_RANK = {(field, rank): compiled for field, rank, compiled in _PATTERN_TABLE}
+_hyperscan_db = None
+_hyperscan_lock = threading.Lock()
+# Hyperscan scratch space is per scan in flight, so each thread keeps its own.
+_hyperscan_local = threading.local()
+_PAGE_OVERLAP = 256
+_REQUIRED_FIELD_COUNT = len(_FIELD_PATTERNS)
+_FIELD_NAMES = tuple(field for field, _ in _FIELD_PATTERNS)
+_PARSE_CACHE_SIZE = 256
+_parse_cache: 'OrderedDict[bytes, Tuple[Tuple[Optional[str], ...], Tuple[str, ...]]]' = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _all_fields_resolved(found: Dict[str, Tuple[int, Optional[str], int]]) -> bool:
+    # A field is settled only by its first-priority pattern; a lower-priority
+    # match can still be displaced by a later first-priority one.
+    return len(found) >= _REQUIRED_FIELD_COUNT and all(entry[0] == 0 for entry in found.values())
+
+
+def _scan_with_master_re(text: str, found: Dict[str, Tuple[int, Optional[str], int]]) -> None:
+    for match in _MASTER_RE.finditer(text):
+        field, rank, captures = _MASTER_BRANCHES[match.lastgroup]
+        if field not in found or rank < found[field][0]:
+            found[field] = (rank, match.group(match.lastgroup) if captures else None, match.start())
+            if rank == 0 and _all_fields_resolved(found):
+                break
+
+
+def _build_keyword_automaton():
+    candidates: Dict[str, List[int]] = {}
+    for pattern_id, (field, rank, compiled) in enumerate(_PATTERN_TABLE):
+        for source in _expand_leading_alternation(compiled.pattern):
+            pattern_ids = candidates.setdefault(_literal_prefix(source), [])
+            if pattern_id not in pattern_ids:
+                pattern_ids.append(pattern_id)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, pattern_ids in candidates.items():
+        automaton.add_word(keyword, (len(keyword), tuple(pattern_ids)))
+    automaton.make_automaton()
+    return automaton
+
+
+_keyword_automaton = _build_keyword_automaton() if AHOCORASICK_SUPPORT else None
+
+
+def _scan_with_keywords(text: str, found: Dict[str, Tuple[int, Optional[str], int]]) -> None:
+    # Every field pattern opens with a literal label, so one Aho-Corasick pass
+    # over the lowercased text finds every offset where a pattern could start,
+    # and re only runs at those offsets. Hits are replayed in text order so
+    # the first match kept for each pattern is its leftmost one. It is only
+    # given ASCII text: str.lower() does not fold the way IGNORECASE does
+    # (the long s in "\u017fum" lowers to itself, yet matches "Sum"), and can
+    # change the length of the text.
+    hits = sorted(
+        (end - length + 1, pattern_id)
+        for end, (length, pattern_ids) in _keyword_automaton.iter(text.lower())
+        for pattern_id in pattern_ids
+    )
+    for start, pattern_id in hits:
+        field, rank, compiled = _PATTERN_TABLE[pattern_id]
+        if field in found and found[field][0] <= rank:
+            continue
+        match = compiled.match(text, start)
+        if match:
+            found[field] = (rank, match.group(1) if compiled.groups else None, start)
+            if rank == 0 and _all_fields_resolved(found):
+                return
+
+
+def _get_hyperscan_db():
+    global _hyperscan_db
+    with _hyperscan_lock:
+        if _hyperscan_db is None:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[compiled.pattern.encode('ascii') for _, _, compiled in _PATTERN_TABLE],
+                ids=list(range(len(_PATTERN_TABLE))),
+                elements=len(_PATTERN_TABLE),
+                flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+            )
+            _hyperscan_db = database
+    return _hyperscan_db
+
+
+def _get_hyperscan_scratch(database):
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(database)
+    return scratch
+
+
+def _scan_with_hyperscan(text: str, found: Dict[str, Tuple[int, Optional[str], int]]) -> None:
+    # Hyperscan only reports which patterns match, so one DFA pass picks the
+    # best-ranked pattern per field and re then pulls the capture group out of
+    # the leftmost match of just those patterns. It is only given ASCII text,
+    # where its caseless matching and \d agree with re's Unicode semantics.
+    ranks = {field: entry[0] for field, entry in found.items()}
+    winners: Dict[str, int] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        field, rank, _ = _PATTERN_TABLE[pattern_id]
+        if rank < ranks.get(field, len(_FIELD_PATTERNS)):
+            ranks[field] = rank
+            winners[field] = pattern_id
+            if rank == 0 and len(ranks) >= _REQUIRED_FIELD_COUNT and not any(ranks.values()):
+                return True
+        return False
+
+    database = _get_hyperscan_db()
+    try:
+        database.scan(text.encode('ascii'), match_event_handler=on_match, scratch=_get_hyperscan_scratch(database))
+    except hyperscan.ScanTerminated:
+        pass
+
+    for field, pattern_id in winners.items():
+        _, rank, compiled = _PATTERN_TABLE[pattern_id]
+        match = compiled.search(text)
+        if match:
+            found[field] = (rank, match.group(1) if compiled.groups else None, match.start())
+
+
+def _clean_text(value: str) -> str:
+    return value.strip()
+
+
+def _clean_numeric(value: str) -> str:
+    return value.replace(',', '').strip()
+
+
+def _clean_date(value: str) -> str:
+    return value.strip().replace('-', '/')
+
+
+# Payment frequencies come from a handful of words, so every record shares
+# one interned string per frequency instead of holding its own copy.
+_FREQ_INTERN = {
+    frequency: sys.intern(frequency)
+    for frequency in (
+        'monthly', 'quarterly', 'annual', 'yearly',
+        'biannual', 'bi-annual', 'semiannual', 'semi-annual',
+    )
+}
+
+
+def _clean_frequency(value: str) -> str:
+    frequency = value.strip().lower()
+    return _FREQ_INTERN.get(frequency, frequency)
+
+
+_FIELD_CLEANERS = {
+    'policy_number': _clean_text,
+    'policyholder': _clean_text,
+    'policy_type': _clean_text,
+    'effective_date': _clean_date,
+    'expiration_date': _clean_date,
+    'coverage_amount': _clean_numeric,
+    'premium': _clean_numeric,
+    'total_premium': _clean_numeric,
+    'taxes': _clean_numeric,
+    'fees': _clean_numeric,
+    'deductible': _clean_numeric,
+    'payment_frequency': _clean_frequency,
+    'copay': _clean_numeric,
+}
+
+
+def _read_txt(file_path: str) -> bytearray:
+    # Reads straight into a buffer sized from fstat, skipping the text-mode
+    # wrapper. The spare byte lets the final empty readinto confirm the end of
+    # the file; a file that grows meanwhile, or a pipe or procfs file that
+    # reports a size of 0, grows the buffer until readinto returns 0.
+    with open(file_path, 'rb', buffering=0) as file:
+        buffer = bytearray(os.fstat(file.fileno()).st_size + 1)
+        filled = 0
+        while True:
+            if filled == len(buffer):
+                buffer.extend(bytes(len(buffer)))
+            with memoryview(buffer) as view:
+                count = file.readinto(view[filled:])
+            if not count:
+                break
+            filled += count
+    del buffer[filled:]
+    return buffer
+
+
+def _decode_txt(data: bytearray) -> str:
+    # The text open(file_path, 'r', encoding='utf-8') would give, newline
+    # translation included.
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _txt_pages(data: bytearray) -> Iterator[str]:
+    yield _decode_txt(data)
+
+
+def _load_pdfplumber():
+    global _pdfplumber, PDF_SUPPORT
+    if PDF_SUPPORT is None:
+        try:
+            import pdfplumber
+        except ImportError:
+            PDF_SUPPORT = False
+        else:
+            _pdfplumber = pdfplumber
+            PDF_SUPPORT = True
+    if not PDF_SUPPORT:
+        raise ImportError("pdfplumber not installed. Install with: pip install pdfplumber")
+    return _pdfplumber
+
+
+def _iter_pdf_pages(file_path: str) -> Iterator[str]:
+    pdfplumber = _load_pdfplumber()
+    
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            page.close()
+            if page_text:
+                yield page_text
+
+
+def _iter_txt_pages(file_path: str) -> Iterator[str]:
+    yield _decode_txt(_read_txt(file_path))
+
+
+_PAGE_READERS: Dict[str, Callable[[str], Iterator[str]]] = {
+    '.pdf': _iter_pdf_pages,
+    '.txt': _iter_txt_pages,
+}
+
+
+def iter_pages(file_path: str) -> Iterator[str]:
+    file_extension = Path(file_path).suffix.lower()
+    reader = _PAGE_READERS.get(file_extension)
+    if reader is None:
+        raise ValueError(f"Unsupported file type: {file_extension}. Use .txt or .pdf")
+    return reader(file_path)
+
 
 def extract_text_from_file(file_path: str) -> str:
+    return '\n'.join(iter_pages(file_path))
+
+
+def _hashed_pages(file_path: str) -> Tuple[bytes, Iterator[str]]:
+    # Returns a BLAKE2b digest of the file's bytes along with its pages. A
+    # .txt file is read once for both; other files are hashed in blocks and
+    # then read by their page reader. The extension decides how the bytes are
+    # read, so it is part of the digest.
     file_extension = Path(file_path).suffix.lower()
+    digest = hashlib.blake2b(file_extension.encode(), digest_size=16)
+    if file_extension == '.txt':
+        data = _read_txt(file_path)
+        digest.update(data)
+        return digest.digest(), _txt_pages(data)
     
-    if file_extension == '.pdf':
-        if not PDF_SUPPORT:
-            raise ImportError("pdfplumber not installed. Install with: pip install pdfplumber")
-        
-        text_content = []
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_content.append(page_text)
-        return '\n'.join(text_content)
-    
-    elif file_extension == '.txt':
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    
-    else:
-        raise ValueError(f"Unsupported file type: {file_extension}. Use .txt or .pdf")
+    pages = iter_pages(file_path)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 16), b''):
+            digest.update(block)
+    return digest.digest(), pages
+
+
+def _coverage_items(section_content: str) -> List[str]:
+    return _ITEM_RE.findall(section_content)
+
+
+class _FieldScanner:
+    """Accumulates field matches over the normalized pages of a document."""
+
+    def __init__(self):
+        self.found: Dict[str, Tuple[int, Optional[str], int]] = {}
+        self._tail = ''
+        # Fields whose match ran into the end of the previous chunk, keyed to
+        # the offset of that match in _tail.
+        self._pending: Dict[str, int] = {}
+
+    def feed(self, text: str) -> None:
+        # The tail of the previous page is rescanned so a label at the bottom
+        # of one page still pairs with its value at the top of the next.
+        chunk = f'{self._tail}\n{text}' if self._tail else text
+        updated = set()
+        for field, start in self._pending.items():
+            rank = self.found[field][0]
+            match = _PATTERNS_BY_RANK[field, rank].match(chunk, start)
+            if match:
+                self.found[field] = (rank, match.group(1) if match.re.groups else None, start)
+                updated.add(field)
+            else:
+                del self.found[field]
+
+        previous = dict(self.found)
+        if HYPERSCAN_SUPPORT and chunk.isascii():
+            _scan_with_hyperscan(chunk, self.found)
+        elif AHOCORASICK_SUPPORT and chunk.isascii():
+            _scan_with_keywords(chunk, self.found)
+        else:
+            _scan_with_master_re(chunk, self.found)
+        updated.update(field for field, entry in self.found.items() if previous.get(field) is not entry)
+
+        # A match that reaches into the last _PAGE_OVERLAP characters may come
+        # out differently once the next page follows, so it stays in the tail
+        # and is matched again on the next feed. On the last page it stands.
+        hold_from = len(chunk) - _PAGE_OVERLAP
+        self._pending = {}
+        for field in updated:
+            rank, _, start = self.found[field]
+            if start < hold_from:
+                match = _PATTERNS_BY_RANK[field, rank].match(chunk, start)
+                if match and match.end() <= hold_from:
+                    continue
+            self._pending[field] = start
+        tail_start = max(min(hold_from, *self._pending.values()) if self._pending else hold_from, 0)
+        self._tail = chunk[tail_start:]
+        self._pending = {field: start - tail_start for field, start in self._pending.items()}
+
+    @property
+    def complete(self) -> bool:
+        return not self._pending and _all_fields_resolved(self.found)
+
+    def fields(self) -> Dict[str, str]:
+        return {
+            field: _FIELD_CLEANERS[field](value)
+            for field, (rank, value, _) in self.found.items()
+            if value is not None
+        }
+
+
+class _CoverageCollector:
+    """Finds the coverage details section while only buffering the pages it spans."""
+
+    def __init__(self):
+        self.items: Optional[List[str]] = None
+        self._buffer: Optional[str] = None
+
+    def feed(self, page_text: str) -> None:
+        if self.items is not None:
+            return
+        self._buffer = page_text if self._buffer is None else f'{self._buffer}\n{page_text}'
+        section_match = _COVERAGE_DETAILS_RE.search(self._buffer)
+        if section_match is None:
+            self._buffer = None
+        elif section_match.end() < len(self._buffer):
+            self.items = _coverage_items(section_match.group(1))
+        else:
+            self._buffer = self._buffer[section_match.start():]
+
+    def finish(self) -> List[str]:
+        if self.items is None:
+            section_match = _COVERAGE_DETAILS_RE.search(self._buffer) if self._buffer else None
+            self.items = _coverage_items(section_match.group(1)) if section_match else []
+        return self.items
 
 
 class InsuranceParser:
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.raw_text = ""
-        self.normalized_text = ""
+        self._raw_text = ""
+        self._normalized_text = ""
+        self._text_pending = False
         self.parsed_data = {}
 
+    # parse() streams the document without keeping its text, so after a parse
+    # the file is read again, once, the first time either attribute is used.
+    # That read sees the file as it is then, not as parse() saw it. If it
+    # fails, both stay "" and the extract_* methods return None or [].
+    @property
+    def raw_text(self) -> str:
+        self._load_pending_text()
+        return self._raw_text
+
+    @raw_text.setter
+    def raw_text(self, value: str) -> None:
+        self._raw_text = value
+
+    @property
+    def normalized_text(self) -> str:
+        self._load_pending_text()
+        return self._normalized_text
+
+    @normalized_text.setter
+    def normalized_text(self, value: str) -> None:
+        self._normalized_text = value
+
+    def _load_pending_text(self) -> None:
+        if self._text_pending:
+            try:
+                self.read_document()
+            except Exception:
+                pass
+
     def normalize_text(self, text: str) -> str:
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            trimmed = line.strip()
-            single_spaced = ' '.join(trimmed.split())
-            cleaned_lines.append(single_spaced)
-        
-        normalized = '\n'.join(cleaned_lines)
-        normalized = re.sub(r'\n{3,}', '\n\n', normalized)
+        if len(text) >= _NUMBA_MIN_LENGTH and text.isascii():
+            kernel = _load_normalize_kernel()
+            if kernel is not None:
+                return kernel(text)
+
+        # str.split() already drops leading/trailing whitespace, and mapping the
+        # C-level str methods over the lines avoids a Python loop per line.
+        normalized = '\n'.join(map(' '.join, map(str.split, text.split('\n'))))
+        normalized = _BLANK_RUN.sub('\n\n', normalized)
         
         return normalized
 
-    def _extract_with_patterns(self, patterns: List[str], clean_numeric: bool = False) -> Optional[str]:
+    def _extract_with_patterns(self, patterns: Sequence[re.Pattern], clean_numeric: bool = False) -> Optional[str]:
         for pattern in patterns:
-            match = re.search(pattern, self.normalized_text, re.IGNORECASE)
+            match = pattern.search(self.normalized_text)
             if match:
-                extracted_value = match.group(1)
+                # A pattern without a capture group (or an unmatched optional
+                # one) yields no value.
+                extracted_value = match.group(1) if pattern.groups else None
+                if extracted_value is None:
+                    return None
                 if clean_numeric:
                     extracted_value = extracted_value.replace(',', '')
-                return extracted_value.strip() if isinstance(extracted_value, str) else extracted_value
+                return extracted_value.strip()
         return None
 
+    def _scan_document(self) -> Tuple[Dict[str, str], List[str]]:
+        digest, pages = _hashed_pages(self.file_path)
+        with _parse_cache_lock:
+            cached = _parse_cache.get(digest)
+            if cached is not None:
+                _parse_cache.move_to_end(digest)
+        if cached is not None:
+            field_values, coverage_details = cached
+            return dict(zip(_FIELD_NAMES, field_values)), list(coverage_details)
+
+        field_scanner = _FieldScanner()
+        coverage_collector = _CoverageCollector()
+        with closing(pages) as pages:
+            for page_text in pages:
+                if not field_scanner.complete:
+                    field_scanner.feed(self.normalize_text(page_text))
+                coverage_collector.feed(page_text)
+                if field_scanner.complete and coverage_collector.items is not None:
+                    break
+        fields = field_scanner.fields()
+        coverage_details = coverage_collector.finish()
+
+        with _parse_cache_lock:
+            _parse_cache[digest] = (tuple(fields.get(name) for name in _FIELD_NAMES), tuple(coverage_details))
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        return fields, coverage_details
+
     def read_document(self) -> str:
+        self._text_pending = False
         try:
             self.raw_text = extract_text_from_file(self.file_path)
         except FileNotFoundError:
@@ -99,163 +744,56 @@ class InsuranceParser:
         return self.raw_text
 
     def extract_policy_number(self) -> Optional[str]:
-        try:
-            patterns = [
-                r'Policy\s+(?:Number|No\.?|#)\s*:?\s*([A-Z0-9][A-Z0-9-/\\]+)'
-            ]
-            return self._extract_with_patterns(patterns)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_POLICY_NUMBER_RES)
 
     def extract_policyholder(self) -> Optional[str]:
-        try:
-            patterns = [
-                r'Policyholder(?:\s+Name)?:\s*([A-Za-z\s]+?)(?:\n|$)'
-            ]
-            return self._extract_with_patterns(patterns)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_POLICYHOLDER_RES)
 
     def extract_policy_type(self) -> Optional[str]:
-        try:
-            patterns = [
-                r'Policy\s+Type:\s*([A-Za-z\s]+?)(?:\n|$)'
-            ]
-            return self._extract_with_patterns(patterns)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_POLICY_TYPE_RES)
 
     def extract_effective_date(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:Effective|Start|Commencement|From)\s+Date\s*:?\s*{DATE_PATTERN}',
-                rf'Policy\s+(?:Start|Effective)\s+Date\s*:?\s*{DATE_PATTERN}',
-                rf'(?:Valid|Coverage)\s+From\s*:?\s*{DATE_PATTERN}'
-            ]
-            date_value = self._extract_with_patterns(patterns)
-            if date_value:
-                return date_value.replace('-', '/')
-            return None
-        except Exception:
-            return None
+        date_value = self._extract_with_patterns(_EFFECTIVE_DATE_RES)
+        if date_value:
+            return date_value.replace('-', '/')
+        return None
 
     def extract_expiration_date(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:Expiration|Expiry|End|To)\s+Date\s*:?\s*{DATE_PATTERN}',
-                rf'Policy\s+(?:End|Expiry)\s+Date\s*:?\s*{DATE_PATTERN}',
-                rf'(?:Valid|Coverage)\s+(?:Until|To)\s*:?\s*{DATE_PATTERN}'
-            ]
-            date_value = self._extract_with_patterns(patterns)
-            if date_value:
-                return date_value.replace('-', '/')
-            return None
-        except Exception:
-            return None
+        date_value = self._extract_with_patterns(_EXPIRATION_DATE_RES)
+        if date_value:
+            return date_value.replace('-', '/')
+        return None
 
     def extract_coverage_amount(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:Coverage|Sum)\s+(?:Amount|Insured)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Sum\s+Insured\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Insured\s+(?:Amount|Value)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_COVERAGE_AMOUNT_RES, clean_numeric=True)
 
     def extract_premium(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:Base|Basic|Net)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Monthly|Annual|Yearly)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_PREMIUM_RES, clean_numeric=True)
 
     def extract_total_premium(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'Total\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Gross|Final)\s+Premium\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Premium\s+(?:Total|Amount)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_TOTAL_PREMIUM_RES, clean_numeric=True)
 
     def extract_taxes(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:GST|Tax|Service\s+Tax)\s*(?:Amount)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Tax(?:es)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Policy|Insurance)\s+Tax\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'GST\s*@?\s*\d+%?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_TAXES_RES, clean_numeric=True)
 
     def extract_fees(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'(?:Administrative|Processing|Service)\s+Fee\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'Fee(?:s)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Stamp|Policy)\s+Fee\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_FEES_RES, clean_numeric=True)
 
     def extract_deductible(self) -> Optional[str]:
-        try:
-            patterns = [
-                rf'Deductible\s*(?:Amount)?\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Standard|Basic)\s+Deductible\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}',
-                rf'(?:Excess|Co-payment)\s*:?\s*{CURRENCY_SYMBOLS}\s*{NUMERIC_PATTERN}'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_DEDUCTIBLE_RES, clean_numeric=True)
 
     def extract_payment_frequency(self) -> Optional[str]:
-        try:
-            patterns = [
-                r'Payment\s+Frequency\s*:?\s*((?:Monthly|Quarterly|Annual|Yearly|Bi-?annual|Semi-?annual))',
-                r'Billed\s+(Monthly|Quarterly|Annual|Yearly)',
-                r'(?:Monthly|Quarterly|Annual|Yearly)\s+(?:Payment|Billing)'
-            ]
-            frequency = self._extract_with_patterns(patterns)
-            return frequency.lower() if frequency else None
-        except Exception:
-            return None
+        frequency = self._extract_with_patterns(_PAYMENT_FREQUENCY_RES)
+        return _clean_frequency(frequency) if frequency else None
 
     def extract_copay(self) -> Optional[str]:
-        try:
-            patterns = [
-                r'Co-?pay\s*:?\s*\$?([\d,]+(?:\.\d{2})?)',
-                r'Copayment\s*:?\s*\$?([\d,]+(?:\.\d{2})?)'
-            ]
-            return self._extract_with_patterns(patterns, clean_numeric=True)
-        except Exception:
-            return None
+        return self._extract_with_patterns(_COPAY_RES, clean_numeric=True)
 
     def extract_coverage_details(self) -> List[str]:
-        try:
-            section_match = re.search(
-                r'Coverage Details:(.*?)(?=\n\n|\Z)', 
-                self.raw_text, 
-                re.DOTALL | re.IGNORECASE
-            )
-            if section_match:
-                section_content = section_match.group(1)
-                items = re.findall(r'-\s*(.+)', section_content)
-                return [item.strip() for item in items]
-            return []
-        except Exception:
-            return []
+        section_match = _COVERAGE_DETAILS_RE.search(self.raw_text)
+        if section_match:
+            return _coverage_items(section_match.group(1))
+        return []
 
     def validate_parsed_data(self) -> Dict[str, bool]:
         has_policy_number = self.parsed_data.get('policy_number') is not None
@@ -299,25 +837,26 @@ class InsuranceParser:
 
     def parse(self) -> Dict:
         try:
-            self.read_document()
+            fields, coverage_details = self._scan_document()
         except Exception:
             return self.get_default_structure()
+        self._text_pending = True
         
         self.parsed_data = {
-            'policy_number': self.extract_policy_number(),
-            'policyholder': self.extract_policyholder(),
-            'policy_type': self.extract_policy_type(),
-            'effective_date': self.extract_effective_date(),
-            'expiration_date': self.extract_expiration_date(),
-            'coverage_amount': self.extract_coverage_amount(),
-            'premium': self.extract_premium(),
-            'total_premium': self.extract_total_premium(),
-            'taxes': self.extract_taxes(),
-            'fees': self.extract_fees(),
-            'deductible': self.extract_deductible(),
-            'payment_frequency': self.extract_payment_frequency(),
-            'copay': self.extract_copay(),
-            'coverage_details': self.extract_coverage_details(),
+            'policy_number': fields.get('policy_number'),
+            'policyholder': fields.get('policyholder'),
+            'policy_type': fields.get('policy_type'),
+            'effective_date': fields.get('effective_date'),
+            'expiration_date': fields.get('expiration_date'),
+            'coverage_amount': fields.get('coverage_amount'),
+            'premium': fields.get('premium'),
+            'total_premium': fields.get('total_premium'),
+            'taxes': fields.get('taxes'),
+            'fees': fields.get('fees'),
+            'deductible': fields.get('deductible'),
+            'payment_frequency': fields.get('payment_frequency'),
+            'copay': fields.get('copay'),
+            'coverage_details': coverage_details,
             'parsed_at': datetime.now().isoformat()
         }
         
@@ -325,8 +864,14 @@ class InsuranceParser:
 
     def save_to_json(self, output_path: str) -> None:
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump(self.parsed_data, file, indent=4, ensure_ascii=False)
+            # orjson only indents by two spaces, so the json fallback does the
+            # same and the file comes out byte-for-byte identical either way.
+            if ORJSON_SUPPORT:
+                with open(output_path, 'wb') as file:
+                    file.write(orjson.dumps(self.parsed_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as file:
+                    json.dump(self.parsed_data, file, indent=2, ensure_ascii=False)
         except PermissionError:
             raise PermissionError(f"Permission denied writing to: {output_path}")
         except Exception as e:
@@ -337,6 +882,111 @@ class InsuranceParser:
         return output_path
 
 
+def _column_and(columns):
+    np = _load_numpy()
+    if np is not None:
+        return np.logical_and.reduce(columns)
+    return [all(flags) for flags in zip(*columns)]
+
+
+def _column_or(columns):
+    np = _load_numpy()
+    if np is not None:
+        return np.logical_or.reduce(columns)
+    return [any(flags) for flags in zip(*columns)]
+
+
+def _is_set(values: List):
+    flags = [value is not None for value in values]
+    np = _load_numpy()
+    return np.array(flags, dtype=bool) if np is not None else flags
+
+
+def _is_truthy(values: List):
+    flags = [bool(value) for value in values]
+    np = _load_numpy()
+    return np.array(flags, dtype=bool) if np is not None else flags
+
+
+@dataclasses.dataclass
+class ParsedBatch:
+    """Parsed documents stored column-wise, one list per field."""
+
+    policy_number: List[Optional[str]] = dataclasses.field(default_factory=list)
+    policyholder: List[Optional[str]] = dataclasses.field(default_factory=list)
+    policy_type: List[Optional[str]] = dataclasses.field(default_factory=list)
+    effective_date: List[Optional[str]] = dataclasses.field(default_factory=list)
+    expiration_date: List[Optional[str]] = dataclasses.field(default_factory=list)
+    coverage_amount: List[Optional[str]] = dataclasses.field(default_factory=list)
+    premium: List[Optional[str]] = dataclasses.field(default_factory=list)
+    total_premium: List[Optional[str]] = dataclasses.field(default_factory=list)
+    taxes: List[Optional[str]] = dataclasses.field(default_factory=list)
+    fees: List[Optional[str]] = dataclasses.field(default_factory=list)
+    deductible: List[Optional[str]] = dataclasses.field(default_factory=list)
+    payment_frequency: List[Optional[str]] = dataclasses.field(default_factory=list)
+    copay: List[Optional[str]] = dataclasses.field(default_factory=list)
+    coverage_details: List[Optional[List[str]]] = dataclasses.field(default_factory=list)
+    parsed_at: List[Optional[str]] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_docs(cls, docs: Iterable[Dict]) -> 'ParsedBatch':
+        batch = cls()
+        columns = [(column.name, getattr(batch, column.name)) for column in dataclasses.fields(cls)]
+        for doc in docs:
+            for name, values in columns:
+                values.append(doc.get(name))
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.policy_number)
+
+    def validate(self) -> Dict:
+        # Same checks as InsuranceParser.validate_parsed_data, one column per
+        # check; NumPy bool arrays when available, lists of bools otherwise.
+        has_policy_number = _is_set(self.policy_number)
+        has_policyholder = _is_set(self.policyholder)
+        has_dates = _column_and([_is_set(self.effective_date), _is_set(self.expiration_date)])
+        has_financial_data = _column_or([
+            _is_truthy(self.premium),
+            _is_truthy(self.coverage_amount),
+            _is_truthy(self.total_premium),
+        ])
+
+        return {
+            'has_policy_number': has_policy_number,
+            'has_policyholder': has_policyholder,
+            'has_dates': has_dates,
+            'has_financial_data': has_financial_data,
+            'is_complete': _column_and([has_policy_number, has_policyholder, has_dates, has_financial_data]),
+        }
+
+
+def _is_large_file(file_path: str) -> bool:
+    try:
+        return Path(file_path).stat().st_size >= _NUMBA_MIN_LENGTH
+    except OSError:
+        return False
+
+
+def _parse_one(file_path: str) -> Dict:
+    return InsuranceParser(file_path).parse()
+
+
+def parse_many(file_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+    if workers == 1:
+        return [_parse_one(file_path) for file_path in file_paths]
+    
+    # The scanners are built lazily, so build them here once; forked workers
+    # then inherit them instead of each compiling its own copy.
+    if HYPERSCAN_SUPPORT:
+        _get_hyperscan_db()
+    if any(_is_large_file(file_path) for file_path in file_paths):
+        _load_normalize_kernel()
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_one, file_paths, chunksize=4))
+
+
 def main():
     input_file = 'sample_insurance_policy.pdf'
     output_file = 'sample_output.json'
@@ -1,5 +1,11 @@
 import json
-from parser import InsuranceParser
+import parser as parser_module
+from parser import InsuranceParser, ParsedBatch, parse_many, _FieldScanner, _FIELD_PATTERNS, _MASTER_BRANCHES, _MASTER_RE, _expand_leading_alternation
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 
 def test_sample_document():
@@ -19,6 +25,9 @@ def test_sample_document():
     
     print(f"\nCoverage Details: {len(parsed_data.get('coverage_details', []))} items found")
     
+    assert parser.raw_text and parser.normalized_text
+    assert parser.extract_policy_number() == parsed_data['policy_number']
+    
     validation = parser.validate_parsed_data()
     print("\nValidation Results:")
     print("-" * 50)
@@ -58,6 +67,243 @@ def test_missing_fields():
     os.remove('test_incomplete.txt')
 
 
+def _example_text(items) -> str:
+    # The shortest text a parsed pattern matches, taking the first option at
+    # every choice; assertions such as $ consume nothing.
+    text = ''
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            text += chr(av)
+        elif op is sre_parse.IN:
+            kind, value = av[0]
+            if kind is sre_parse.LITERAL:
+                text += chr(value)
+            elif kind is sre_parse.RANGE:
+                text += chr(value[0])
+            else:
+                text += '1' if value is sre_parse.CATEGORY_DIGIT else ' '
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            text += _example_text(av[2]) * av[0]
+        elif op is sre_parse.SUBPATTERN:
+            text += _example_text(av[-1])
+        elif op is sre_parse.BRANCH:
+            text += _example_text(av[1][0])
+    return text
+
+
+def test_master_pattern_round_trip():
+    print("\n\nTesting the fused master pattern against each field pattern")
+    print("=" * 50)
+    
+    # parse() relies on two things here: the master pattern rebuilds every
+    # field pattern faithfully, and no text matches patterns of two fields at
+    # the same offset, since the master only reports the first branch.
+    for field, patterns in _FIELD_PATTERNS:
+        for rank, compiled in enumerate(patterns):
+            for source in _expand_leading_alternation(compiled.pattern):
+                sample = _example_text(sre_parse.parse(source))
+                assert compiled.match(sample), (field, rank, sample)
+                
+                others = [name for name, other in _FIELD_PATTERNS
+                          if name != field and any(p.match(sample) for p in other)]
+                assert not others, (field, sample, others)
+                
+                best_rank, best = next((r, p.match(sample)) for r, p in enumerate(patterns) if p.match(sample))
+                master = _MASTER_RE.match(sample)
+                assert master and master.lastgroup in _MASTER_BRANCHES, (field, rank, sample)
+                assert _MASTER_BRANCHES[master.lastgroup][:2] == (field, best_rank), (field, rank, sample)
+                expected = best.group(1) if best.re.groups else ''
+                assert master.group(master.lastgroup) == expected, (field, rank, sample)
+    print("\nEvery field pattern round-trips through the master pattern")
+
+
+def test_batch_parsing():
+    print("\n\nTesting batch parsing")
+    print("=" * 50)
+    
+    file_paths = ['sample_insurance_policy.txt'] * 5
+    expected = InsuranceParser('sample_insurance_policy.txt').parse()
+    
+    for workers in (1, 2):
+        results = parse_many(file_paths, workers=workers)
+        assert len(results) == len(file_paths)
+        for parsed_data in results:
+            assert {k: v for k, v in parsed_data.items() if k != 'parsed_at'} == \
+                {k: v for k, v in expected.items() if k != 'parsed_at'}
+    
+    validation = ParsedBatch.from_docs(results + [InsuranceParser('missing.txt').parse()]).validate()
+    assert list(validation['is_complete']) == [True] * len(results) + [False]
+    
+    print(f"\nParsed {len(results)} documents in parallel")
+
+
+def test_cached_parse():
+    print("\n\nTesting repeated parsing of identical content")
+    print("=" * 50)
+    
+    with open('sample_insurance_policy.txt', 'r', encoding='utf-8') as f:
+        content = f.read()
+    with open('test_copy.txt', 'w', encoding='utf-8') as f:
+        f.write(content)
+    
+    first = InsuranceParser('sample_insurance_policy.txt').parse()
+    first['coverage_details'].clear()
+    second = InsuranceParser('test_copy.txt').parse()
+    
+    assert second['policy_number'] == first['policy_number']
+    assert len(second['coverage_details']) == 6
+    print("\nIdentical content returns the cached fields without sharing state")
+    
+    import os
+    stat = os.stat('test_copy.txt')
+    with open('test_copy.txt', 'w', encoding='utf-8') as f:
+        f.write(content.replace('HOM-2024-789456', 'HOM-2024-789457'))
+    os.utime('test_copy.txt', ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert InsuranceParser('test_copy.txt').parse()['policy_number'] == 'HOM-2024-789457'
+    print("A same-size rewrite with the old mtime is parsed again")
+    
+    os.remove('test_copy.txt')
+
+
+def test_unsized_text_file():
+    print("\n\nTesting a .txt file whose size is not known up front")
+    print("=" * 50)
+    
+    import os
+    import threading
+    if not hasattr(os, 'mkfifo'):
+        print("\nSkipped: named pipes are not available")
+        return
+    
+    with open('sample_insurance_policy.txt', 'r', encoding='utf-8') as f:
+        content = f.read()
+    os.mkfifo('test_pipe.txt')
+    
+    def write_pipe():
+        with open('test_pipe.txt', 'w', encoding='utf-8') as f:
+            for start in range(0, len(content), 100):
+                f.write(content[start:start + 100])
+                f.flush()
+    
+    writer = threading.Thread(target=write_pipe)
+    writer.start()
+    try:
+        parsed_data = InsuranceParser('test_pipe.txt').parse()
+    finally:
+        writer.join()
+        os.remove('test_pipe.txt')
+    
+    assert parsed_data['policy_number'] == 'HOM-2024-789456'
+    assert len(parsed_data['coverage_details']) == 6
+    print("\nA pipe reporting size 0 is read to the end")
+
+
+def test_json_export():
+    print("\n\nTesting JSON export with and without orjson")
+    print("=" * 50)
+    
+    parser = InsuranceParser('sample_insurance_policy.txt')
+    parser.parse()
+    
+    saved = parser_module.ORJSON_SUPPORT
+    outputs = []
+    try:
+        for orjson_support in sorted({False, saved}):
+            parser_module.ORJSON_SUPPORT = orjson_support
+            parser.save_to_json('test_output.json')
+            with open('test_output.json', 'rb') as f:
+                outputs.append(f.read())
+    finally:
+        parser_module.ORJSON_SUPPORT = saved
+    
+    assert json.loads(outputs[0]) == parser.parsed_data
+    assert all(output == outputs[0] for output in outputs)
+    print(f"\n{len(outputs)} writer(s) give identical files")
+    
+    import os
+    os.remove('test_output.json')
+
+
+def test_page_splits():
+    print("\n\nTesting fields split across page boundaries")
+    print("=" * 50)
+    
+    with open('sample_insurance_policy.txt', 'r', encoding='utf-8') as f:
+        content = f.read().replace('Premium: $1,850.00', 'Premium: $1,850.00\nGST @ 18%: USD 333.00')
+    
+    parser = InsuranceParser('split.txt')
+    for cut in range(1, len(content)):
+        pages = (content[:cut], content[cut:])
+        scanner = _FieldScanner()
+        for page in pages:
+            scanner.feed(parser.normalize_text(page))
+        
+        parser.raw_text = '\n'.join(pages)
+        parser.normalized_text = parser.normalize_text(parser.raw_text)
+        expected = {
+            field: getattr(parser, f'extract_{field}')()
+            for field in ('policy_number', 'policyholder', 'policy_type', 'effective_date',
+                          'expiration_date', 'coverage_amount', 'premium', 'total_premium',
+                          'taxes', 'fees', 'deductible', 'payment_frequency', 'copay')
+        }
+        assert scanner.fields() == {k: v for k, v in expected.items() if v is not None}, cut
+    print("\nStreamed pages give the same fields as the joined text")
+
+
+def test_complete_document_backends():
+    print("\n\nTesting a fully labelled document on every scanner backend")
+    print("=" * 50)
+    
+    with open('test_complete.txt', 'w', encoding='utf-8') as f:
+        f.write(
+            "Policy Number: ABC-123\n"
+            "Policyholder: Jane Roe\n"
+            "Policy Type: Auto\n"
+            "Effective Date: 01/01/2024\n"
+            "Expiration Date: 01/01/2025\n"
+            "Coverage Amount: $10,000\n"
+            "Base Premium: $500\n"
+            "Total Premium: $590\n"
+            "GST: $90\n"
+            "Administrative Fee: $10\n"
+            "Deductible: $250\n"
+            "Payment Frequency: Monthly\n"
+            "Copay: $20\n"
+        )
+    
+    backends = [('re', False, False)]
+    if parser_module.AHOCORASICK_SUPPORT:
+        backends.append(('aho-corasick', False, True))
+    if parser_module.HYPERSCAN_SUPPORT:
+        backends.append(('hyperscan', True, False))
+    
+    saved = (parser_module.HYPERSCAN_SUPPORT, parser_module.AHOCORASICK_SUPPORT)
+    try:
+        for name, hyperscan_support, ahocorasick_support in backends:
+            parser_module.HYPERSCAN_SUPPORT = hyperscan_support
+            parser_module.AHOCORASICK_SUPPORT = ahocorasick_support
+            parser_module._parse_cache.clear()
+            parsed_data = InsuranceParser('test_complete.txt').parse()
+            assert parsed_data['policy_number'] == 'ABC-123', name
+            assert parsed_data['taxes'] == '90', name
+            assert parsed_data['payment_frequency'] == 'monthly', name
+            assert parsed_data['copay'] == '20', name
+            print(f"✓ {name}")
+    finally:
+        parser_module.HYPERSCAN_SUPPORT, parser_module.AHOCORASICK_SUPPORT = saved
+        parser_module._parse_cache.clear()
+    
+    import os
+    os.remove('test_complete.txt')
+
+
 if __name__ == '__main__':
     test_sample_document()
     test_missing_fields()
+    test_master_pattern_round_trip()
+    test_batch_parsing()
+    test_cached_parse()
+    test_unsized_text_file()
+    test_json_export()
+    test_page_splits()
+    test_complete_document_backends()